@@ -34,11 +34,17 @@ class YogaImageOptimizerApplication(Gtk.Application):
 
         self._main_window = None
         self._executor = None
-        self._futures = []
+        self._pending_futures = set()
+        self._preview_futures = set()
 
     def do_startup(self):
         Gtk.Application.do_startup(self)
 
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 2,
+            thread_name_prefix="yoga-opt",
+        )
+
         # Action: app.about
         action = Gio.SimpleAction.new("about", None)
         action.connect("activate", lambda a, p: self.about())
@@ -91,8 +97,9 @@ class YogaImageOptimizerApplication(Gtk.Application):
             # TODO display a message to inform the user we cannot add files now
             return
 
-        for file_ in files:
-            self.add_image(file_.get_path())
+        with self.image_store.frozen():
+            for file_ in files:
+                self.add_image(file_.get_path())
 
     def about(self):
         about_dialog = AboutDialog(parent=self._main_window)
@@ -101,15 +108,21 @@ class YogaImageOptimizerApplication(Gtk.Application):
 
     def quit(self):
         self.stop_optimization()
+        for future in self._pending_futures | self._preview_futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
         Gtk.Application.quit(self)
 
     def switch_state(self, state):
         self.current_state = state
         self._main_window.switch_state(state)
 
-    def add_image(self, path):
-        input_path = Path(path).resolve()
-        input_size = input_path.stat().st_size
+    def add_image(self, path, input_size=None):
+        # abspath() is a pure string operation, unlike Path.resolve() which
+        # stats every component of the path to resolve symlinks
+        input_path = Path(os.path.abspath(path))
+        if input_size is None:
+            input_size = input_path.stat().st_size
         input_format = find_file_format(input_path)
 
         if input_format is None:
@@ -122,90 +135,146 @@ class YogaImageOptimizerApplication(Gtk.Application):
         if not IMAGES_FORMATS[input_format]["output"]:
             output_format = "jpeg"
 
-        self.image_store.append(
+        iter_ = self.image_store.append(
             input_file=str(input_path),
             output_file=helpers.add_suffix_to_filename(str(input_path)),
             input_size=input_size,
             output_size=0,
             input_format=input_format,
             output_format=output_format,
-            preview=helpers.preview_gdk_pixbuf_from_path(str(input_path)),
         )
 
+        # Decode the preview on a worker thread to keep the UI responsive
+        # when many images are added at once
+        future = self._executor.submit(
+            helpers.preview_gdk_pixbuf_from_path, str(input_path)
+        )
+        future.add_done_callback(
+            lambda fut, iter_=iter_: GLib.idle_add(
+                self._on_preview_ready, iter_, fut
+            )
+        )
+        self._preview_futures.add(future)
+
     def clear_images(self):
         self.image_store.clear()
 
     def open_file(self):
         filenames = open_file_chooser(parent=self._main_window)
-        for filename in filenames:
-            self.add_image(filename)
+        with self.image_store.frozen():
+            for filename in filenames:
+                self.add_image(filename)
 
     def optimize(self):
         self.switch_state(self.STATE_OPTIMIZE)
 
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
-        self._futures = []
-
-        for row in self.image_store.get_all():
-            self._futures.append(
-                self._executor.submit(
-                    yoga.image.optimize,
-                    row["input_file"],
-                    row["output_file"],
-                    {
-                        "output_format": row["output_format"].lower(),
-                        "jpeg_quality": row["jpeg_quality"] / 100,
-                        "webp_quality": row["webp_quality"] / 100,
-                        "png_slow_optimization": row["png_slow_optimization"],
-                    },
+        self._pending_futures = set()
+
+        # Reset every row in a single pass before submitting anything, with
+        # the treeview detached so it repaints once instead of once per row
+        with self.image_store.frozen():
+            for i in range(self.image_store.length):
+                self.image_store.update(
+                    i,
+                    status=self.image_store.STATUS_PENDING,
+                    output_size=0,
                 )
+
+        for i, row in enumerate(self.image_store.get_all()):
+            future = self._executor.submit(
+                self._optimize_image,
+                i,
+                row["input_file"],
+                row["output_file"],
+                {
+                    "output_format": row["output_format"],
+                    "jpeg_quality": row["jpeg_quality"] / 100,
+                    "webp_quality": row["webp_quality"] / 100,
+                    "png_slow_optimization": row["png_slow_optimization"],
+                },
             )
+            future.add_done_callback(
+                lambda fut, i=i: GLib.idle_add(self._on_future_done, i, fut)
+            )
+            self._pending_futures.add(future)
 
-        self._update_optimization_status()
+        # Nothing to optimize: leave the optimization state right away
+        if not self._pending_futures:
+            self.stop_optimization()
 
     def stop_optimization(self):
         if self.current_state != self.STATE_OPTIMIZE:
             return
 
-        self._executor.shutdown(wait=False)
-        for future in self._futures:
+        # Only cancel pending futures: the executor is kept alive so that its
+        # worker threads can be reused by the next optimization run.
+        for future in self._pending_futures:
             future.cancel()
 
         self.switch_state(self.STATE_MANAGE_IMAGES)
 
-    def _update_optimization_status(self):
-        if self.current_state != self.STATE_OPTIMIZE:
-            return
+    def _on_preview_ready(self, iter_, future):
+        self._preview_futures.discard(future)
+
+        if future.cancelled():
+            return GLib.SOURCE_REMOVE
+
+        error = future.exception()
+        if error is not None:
+            print("W: Unable to generate the preview image: %s" % error)
+        elif self.image_store.gtk_list_store.iter_is_valid(iter_):
+            self.image_store.update(iter_, preview=future.result())
+        return GLib.SOURCE_REMOVE
+
+    def _optimize_image(self, index, input_file, output_file, options):
+        # Runs on a worker thread: flag the image as "in progress" from the
+        # main loop, then run the actual optimization.
+        # The output size was already zeroed when the row was reset to
+        # "pending", so only the status needs to be written here
+        GLib.idle_add(
+            lambda: self.image_store.update(
+                index,
+                status=self.image_store.STATUS_IN_PROGRESS,
+            )
+        )
+        yoga.image.optimize(input_file, output_file, options)
 
-        is_running = False
+    def _on_future_done(self, index, future):
+        # Ignore futures from a previous (stopped) run: running futures
+        # cannot be cancelled and their callbacks still fire, but their row
+        # indexes are meaningless once the run is over. optimize() builds a
+        # fresh set per run, so membership identifies the current run.
+        if future not in self._pending_futures:
+            return GLib.SOURCE_REMOVE
 
-        for i in range(len(self._futures)):
-            future = self._futures[i]
+        self._pending_futures.discard(future)
+
+        if self.current_state != self.STATE_OPTIMIZE:
+            return GLib.SOURCE_REMOVE
 
-            if future.running():
+        if not future.cancelled():
+            image_data = self.image_store.get(index)
+            error = future.exception()
+
+            if error is not None:
+                print(
+                    "W: Unable to optimize '%s': %s"
+                    % (image_data["input_file"], error)
+                )
                 self.image_store.update(
-                    i,
-                    status=self.image_store.STATUS_IN_PROGRESS,
-                    output_size=0,
+                    index,
+                    status=self.image_store.STATUS_NONE,
                 )
-                is_running = True
-            elif future.done():
-                image_data = self.image_store.get(i)
+            else:
                 output_size = os.stat(image_data["output_file"]).st_size
 
                 self.image_store.update(
-                    i,
+                    index,
                     status=self.image_store.STATUS_DONE,
                     output_size=output_size,
                 )
-            else:
-                self.image_store.update(
-                    i,
-                    status=self.image_store.STATUS_PENDING,
-                    output_size=0,
-                )
 
-        if is_running:
-            GLib.timeout_add_seconds(0.1, self._update_optimization_status)
-        else:
+        if not self._pending_futures:
             self.stop_optimization()
+
+        return GLib.SOURCE_REMOVE
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from PIL import Image
@@ -9,6 +10,15 @@ from .translation import gettext as _
 from .translation import format_string
 
 
+_BYTES_LABEL = _("Bytes")
+
+_FILE_SIZE_UNITS = [
+    (_("kiB"), 1024 ** 1),
+    (_("MiB"), 1024 ** 2),
+    (_("GiB"), 1024 ** 3),
+]
+
+
 def human_readable_file_size(size):
     """Returns human readable file size (e.g. "11.4 kiB").
 
@@ -31,12 +41,8 @@ def human_readable_file_size(size):
     '1.50 kiB'
     """
     if size < 1024:
-        return "%i %s" % (size, _("Bytes"))
-    for u, d in [
-        (_("kiB"), 1024 ** 1),
-        (_("MiB"), 1024 ** 2),
-        (_("GiB"), 1024 ** 3),
-    ]:
+        return "%i %s" % (size, _BYTES_LABEL)
+    for u, d in _FILE_SIZE_UNITS:
         if size / d < 1024:
             return "%s %s" % (format_string("%.2f", size / d), u)
     return "∞"
@@ -77,14 +83,27 @@ def add_suffix_to_filename(path, suffix="opti"):
     return str(output_path)
 
 
+_PREVIEW_CACHE_MAX_LENGTH = 256
+_preview_cache = {}
+
+
 def preview_gdk_pixbuf_from_path(path, size=64):
     """Returns a Gdk Pixbuf containing the preview the image at the given path.
 
+    Previews are cached by path, modification time and file size, so adding
+    an unchanged image a second time does not decode it again.
+
     :param str path: The path of the image.
     :param int size: The size of the preview (optional, default: ``64``).
 
     :rtype: GdkPixbuf.Pixbuff
     """
+    stat = os.stat(path)
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size, size)
+
+    if cache_key in _preview_cache:
+        return _preview_cache[cache_key]
+
     image = Image.open(path)
     image.thumbnail([size, size], Image.LANCZOS)
 
@@ -105,4 +124,8 @@ def preview_gdk_pixbuf_from_path(path, size=64):
     image.close()
     image_rgba.close()
 
+    if len(_preview_cache) >= _PREVIEW_CACHE_MAX_LENGTH:
+        _preview_cache.clear()
+    _preview_cache[cache_key] = pixbuf
+
     return pixbuf
@@ -144,6 +144,28 @@ IMAGES_FORMATS = {
 }
 
 
+def _build_exts_dispatch():
+    """Builds the extension dispatch table used by :func:`find_file_format`.
+
+    Maps each file extension to the first format declaring it (following
+    ``IMAGES_FORMATS`` order), for formats recognized by extension only.
+
+    :rtype: dict
+
+    >>> _build_exts_dispatch()[".jpg"]
+    'jpeg'
+    >>> ".webp" in _build_exts_dispatch()
+    True
+    """
+    dispatch = {}
+    for format_id, format_ in IMAGES_FORMATS.items():
+        if format_["check_function"] != "_check_extention":
+            continue
+        for ext in format_["exts"]:
+            dispatch.setdefault(ext, format_id)
+    return dispatch
+
+
 def _check_extention(format_id, filename):
     """Check if the given file name matches the format extension.
 
@@ -183,6 +205,9 @@ def _check_nop(format_id, filename):
     return False
 
 
+_EXTS_DISPATCH = _build_exts_dispatch()
+
+
 def find_file_format(filename):
     """Finds the format of the given file.
 
@@ -197,6 +222,11 @@ def find_file_format(filename):
     'png'
     >>> find_file_format("test.foo")
     """
+    # Fast path: most formats are identified by their extension alone
+    ext = pathlib.Path(filename).suffix.lower()
+    if ext in _EXTS_DISPATCH:
+        return _EXTS_DISPATCH[ext]
+
     for format_id in IMAGES_FORMATS:
         checker_function = globals()[
             IMAGES_FORMATS[format_id]["check_function"]
@@ -1,4 +1,5 @@
 import os
+import contextlib
 from pathlib import Path
 
 from gi.repository import Gtk
@@ -10,6 +11,16 @@ from .translation import gettext as _
 from .translation import format_string
 
 
+_FORMATS_EXTS = {fid: fmt["exts"][0] for fid, fmt in IMAGES_FORMATS.items()}
+
+_STATUS_DISPLAY = {
+    0: "",
+    1: "⏸️ %s" % _("Pending"),
+    2: "🔄️ %s" % _("In progress"),
+    3: "✅️ %s" % _("Done"),
+}
+
+
 class ImageStore(object):
 
     # fmt: off
@@ -35,6 +46,8 @@ class ImageStore(object):
     }
     # fmt: on
 
+    _FIELD_IDS = {name: info["id"] for name, info in FIELDS.items()}
+
     STATUS_NONE = 0
     STATUS_PENDING = 1
     STATUS_IN_PROGRESS = 2
@@ -45,6 +58,16 @@ class ImageStore(object):
     def __init__(self):
         store_fields = sorted(self.FIELDS.values(), key=lambda v: v["id"])
         self.gtk_list_store = Gtk.ListStore(*[f["type"] for f in store_fields])
+        # Field names in column order, to rebuild row dicts in a single pass
+        self._field_names = tuple(
+            sorted(self.FIELDS, key=lambda name: self.FIELDS[name]["id"])
+        )
+        # Treeviews displaying this store (see attach_treeview / frozen)
+        self._treeviews = []
+        # Row template with the default value of each field, in column order.
+        # The values are copied into the GtkListStore on append so the
+        # template itself is never mutated.
+        self._default_row = [f["default"] for f in store_fields]
 
     @property
     def length(self):
@@ -56,10 +79,13 @@ class ImageStore(object):
 
         :param **kwargs: The columns key/value of the row.
 
+        :rtype: gtk.TreeIter
+        :returns: The iter of the appended row.
+
         >>> image_store = ImageStore()
         >>> image_store.length
         0
-        >>> image_store.append(
+        >>> iter_ = image_store.append(
         ...     input_file="/tmp/foobar.png",
         ...     output_file="/tmp/foobar.opti.png",
         ... )
@@ -74,20 +100,49 @@ class ImageStore(object):
             if key not in self.FIELDS:
                 raise KeyError("Invalid field '%s'" % key)
 
-        row = [None] * len(self.FIELDS)
+        iter_ = self.gtk_list_store.append(self._default_row)
+        self.update(iter_, **kwargs)
+        return iter_
+
+    def attach_treeview(self, treeview):
+        """Attaches a treeview displaying this store.
 
-        for key in self.FIELDS:
-            field_info = self.FIELDS[key]
-            row[field_info["id"]] = field_info["default"]
+        The treeview's model is set to the underlying GtkListStore, and the
+        widget is remembered so that :meth:`frozen` can detach it during bulk
+        row insertions and updates.
 
-        iter_ = self.gtk_list_store.append(row)
-        self.update(iter_, **kwargs)
+        :param Gtk.TreeView treeview: The treeview to attach.
+        """
+        treeview.set_model(self.gtk_list_store)
+        self._treeviews.append(treeview)
+
+    @contextlib.contextmanager
+    def frozen(self):
+        """Context manager that detaches the store from the treeviews
+        displaying it while rows are appended or updated in bulk: detached
+        widgets do not process the per-row tree model signals and re-read
+        the whole store once when it is reattached at the end.
+
+        >>> image_store = ImageStore()
+        >>> with image_store.frozen():
+        ...     iter_ = image_store.append()
+        ...     iter_ = image_store.append()
+        >>> image_store.length
+        2
+        """
+        for treeview in self._treeviews:
+            treeview.set_model(None)
+        try:
+            yield
+        finally:
+            for treeview in self._treeviews:
+                treeview.set_model(self.gtk_list_store)
 
     def clear(self):
         """Clears the store.
 
         >>> image_store = ImageStore()
-        >>> image_store.append()
+        >>> iter_ = image_store.append()
         >>> image_store.length
         1
         >>> image_store.clear()
@@ -105,7 +160,7 @@ class ImageStore(object):
         :returns: The row data (e.g. ``{"field_name": "value"}``.
 
         >>> image_store = ImageStore()
-        >>> image_store.append()
+        >>> iter_ = image_store.append()
         >>> image_store.get(0)
         {...}
         >>> image_store.get(1)
@@ -114,12 +169,7 @@ class ImageStore(object):
         IndexError: ...
         """
         row = self.gtk_list_store[index]
-        result = {}
-
-        for field_name, field_info in self.FIELDS.items():
-            result[field_name] = row[field_info["id"]]
-
-        return result
+        return dict(zip(self._field_names, row[:]))
 
     def get_all(self):
         """Get all rows of the store.
@@ -130,8 +180,9 @@ class ImageStore(object):
         >>> image_store.get_all()
         <generator object ImageStore.get_all at ...>
         """
-        for i in range(self.length):
-            yield self.get(i)
+        field_names = self._field_names
+        for row in self.gtk_list_store:
+            yield dict(zip(field_names, row[:]))
 
     def remove(self, iter_):
         """Removes a row at given gtk.TreeIter from the store.
@@ -146,7 +197,7 @@ class ImageStore(object):
         :param int index: The index of the row.
 
         >>> image_store = ImageStore()
-        >>> image_store.append()
+        >>> iter_ = image_store.append()
         >>> image_store.length
         1
         >>> image_store.remove_at_index(0)
@@ -170,7 +221,7 @@ class ImageStore(object):
         :param **kwargs: The columns key/value of the row.
 
         >>> image_store = ImageStore()
-        >>> image_store.append(output_file="aaa.png")
+        >>> iter_ = image_store.append(output_file="aaa.png")
         >>> image_store.get(0)["output_file"]
         'aaa.png'
         >>> image_store.update(0, output_file="bbb.png")
@@ -189,88 +240,80 @@ class ImageStore(object):
             if key not in self.FIELDS:
                 raise KeyError("Invalid field '%s'" % key)
 
+        row = self.gtk_list_store[index]
+        field_ids = self._FIELD_IDS
+
+        # Only write fields whose value actually changed, so that the
+        # derived "*_display" fields below are not recomputed for nothing
+        changed = set()
+
         for key in kwargs:
-            self._update_field(index, key, kwargs[key])
-
-        if "input_file" in kwargs:
-            path = Path(self.get(index)["input_file"])
-            self._update_field(
-                index,
-                "input_file_display",
-                path.name,
+            if row[field_ids[key]] != kwargs[key]:
+                row[field_ids[key]] = kwargs[key]
+                changed.add(key)
+
+        if "input_file" in changed:
+            row[field_ids["input_file_display"]] = os.path.basename(
+                row[field_ids["input_file"]]
             )
 
         if (
-            "output_format" in kwargs
-            or "jpeg_quality" in kwargs
-            or "webp_quality" in kwargs
-            or "png_slow_optimization" in kwargs
+            "output_format" in changed
+            or "jpeg_quality" in changed
+            or "webp_quality" in changed
+            or "png_slow_optimization" in changed
         ):
-            _FORMATS_EXTS = {
-                fid: fmt["exts"][0] for fid, fmt in IMAGES_FORMATS.items()
-            }
-
-            output_format = self.get(index)["output_format"]
+            output_format = row[field_ids["output_format"]]
 
             if output_format == "jpeg":
                 text = "%s (%i %%)" % (
                     IMAGES_FORMATS["jpeg"]["display_name"],
-                    self.get(index)["jpeg_quality"],
+                    row[field_ids["jpeg_quality"]],
                 )
-                self._update_field(index, "output_format_display", text)
+                row[field_ids["output_format_display"]] = text
             elif output_format == "webp":
                 text = "%s (%i %%)" % (
                     IMAGES_FORMATS["webp"]["display_name"],
-                    self.get(index)["webp_quality"],
+                    row[field_ids["webp_quality"]],
                 )
-                self._update_field(index, "output_format_display", text)
+                row[field_ids["output_format_display"]] = text
             elif output_format == "png":
                 text = "%s%s" % (
                     IMAGES_FORMATS["png"]["display_name"],
                     (" (%s)" % "slow")
-                    if self.get(index)["png_slow_optimization"]
+                    if row[field_ids["png_slow_optimization"]]
                     else "",
                 )
-                self._update_field(index, "output_format_display", text)
+                row[field_ids["output_format_display"]] = text
             else:
-                self._update_field(
-                    index,
-                    "output_format_display",
-                    IMAGES_FORMATS[output_format]["display_name"],
-                )
+                row[field_ids["output_format_display"]] = IMAGES_FORMATS[
+                    output_format
+                ]["display_name"]
 
-            output_file = Path(self.get(index)["output_file"])
-
-            self._update_field(
-                index,
-                "output_file",
-                str(output_file.with_suffix(_FORMATS_EXTS[output_format])),
+            output_file = Path(row[field_ids["output_file"]]).with_suffix(
+                _FORMATS_EXTS[output_format]
             )
 
-        if "output_file" in kwargs or "output_format" in kwargs:
-            output_file = Path(self.get(index)["output_file"])
-            input_file = Path(self.get(index)["input_file"])
-            self._update_field(
-                index,
-                "output_file_display",
-                os.path.relpath(
-                    output_file,
-                    start=input_file.parent,
-                ),
-            )
+            row[field_ids["output_file"]] = str(output_file)
+        else:
+            output_file = None
 
-        if "input_size" in kwargs:
-            self._update_field(
-                index,
-                "input_size_display",
-                helpers.human_readable_file_size(
-                    self.get(index)["input_size"]
-                ),
+        if "output_file" in changed or "output_format" in changed:
+            if output_file is None:
+                output_file = Path(row[field_ids["output_file"]])
+            row[field_ids["output_file_display"]] = os.path.relpath(
+                output_file,
+                start=os.path.dirname(row[field_ids["input_file"]]),
             )
 
-        if "output_size" in kwargs:
-            input_size = self.get(index)["input_size"]
-            output_size = self.get(index)["output_size"]
+        if "input_size" in changed:
+            row[
+                field_ids["input_size_display"]
+            ] = helpers.human_readable_file_size(row[field_ids["input_size"]])
+
+        if "output_size" in changed:
+            input_size = row[field_ids["input_size"]]
+            output_size = row[field_ids["output_size"]]
 
             output_size_display = ""
 
@@ -282,25 +325,9 @@ class ImageStore(object):
                     format_string("%.1f", size_delta),
                 )
 
-            self._update_field(
-                index,
-                "output_size_display",
-                output_size_display,
-            )
+            row[field_ids["output_size_display"]] = output_size_display
 
-        if "status" in kwargs:
-            _STATUS = {
-                0: "",
-                1: "⏸️ %s" % _("Pending"),
-                2: "🔄️ %s" % _("In progress"),
-                3: "✅️ %s" % _("Done"),
-            }
-            self._update_field(
-                index,
-                "status_display",
-                _STATUS[self.get(index)["status"]],
-            )
-
-    def _update_field(self, index, field_name, value):
-        row = self.gtk_list_store[index]
-        row[self.FIELDS[field_name]["id"]] = value
+        if "status" in changed:
+            row[field_ids["status_display"]] = _STATUS_DISPLAY[
+                row[field_ids["status"]]
+            ]
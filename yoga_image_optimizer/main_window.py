@@ -212,7 +212,7 @@ class MainWindow(Gtk.ApplicationWindow):
         ]
 
         treeview_images = self._builder.get_object("images_treeview")
-        treeview_images.set_model(app.image_store.gtk_list_store)
+        app.image_store.attach_treeview(treeview_images)
 
         for field_name in DISPLAYED_FIELDS:
             field_type = app.image_store.FIELDS[field_name]["type"]
@@ -259,17 +259,30 @@ class MainWindow(Gtk.ApplicationWindow):
     ):
         app = self.get_application()
 
-        def _add_path(paths):
-            for path in paths:
-                if path.is_dir():
-                    _add_path(p for p in path.glob("**/*") if p.is_file())
-                elif path.is_file():
-                    app.add_image(path)
-                    Gtk.main_iteration_do(True)
+        def _add_dir(dir_path):
+            # A single scandir() pass per directory: is_dir(), is_file() and
+            # stat() reuse the information fetched while listing the entries
+            # Do not follow symlinked directories: the previous glob-based
+            # walk never descended into them, and following them could
+            # recurse forever on symlink cycles
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        _add_dir(entry.path)
+                    elif entry.is_file():
+                        app.add_image(
+                            entry.path,
+                            input_size=entry.stat().st_size,
+                        )
+                        Gtk.main_iteration_do(True)
 
         for uri in data.get_uris():
             path = Path(helpers.gvfs_uri_to_local_path(uri))
-            _add_path([path])
+            if path.is_dir():
+                _add_dir(path)
+            elif path.is_file():
+                app.add_image(path)
+                Gtk.main_iteration_do(True)
 
     def _on_image_treeview_selection_changed(self, selection):
         self.update_interface()